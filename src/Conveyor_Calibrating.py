@@ -1,12 +1,19 @@
+import numpy as np
 from PYSDK_SMART import *
+from conveyorBaseline import baselinePath, saveConveyorProfile, serialPath
+from discoveryCache import discoverCached, saveDiscoveryCache
 
 if __name__ == '__main__':
 
+    # Number of profiles averaged in the calibration of each scanner
+    calibration_profiles = 50
+
     # Initialize sdk library
     sdk_init()
 
-    # Create value for scanners vector's type
-    list_scanners=search()
+    # Scanners of the last run are searched directly by their IPs
+    list_scanners=discoverCached()[0]
+    saveDiscoveryCache(list_scanners)
 
     # Iterate over all available network adapters in the current operating
     # system to send "Hello" requests.
@@ -21,23 +28,33 @@ if __name__ == '__main__':
             print("Não foi possível estabelecer conexão com o scanner, favor verificar se está ligado!")
             continue
 
-        # Get profile from scanner's data stream by Service Protocol.
+        # Get profiles from scanner's data stream by Service Protocol.
         zero_points=True
         realtime=True
-        count=0
-        profile = get_profile2D(scanner,zero_points,realtime,kSERVICE)
-
-        if (is_connected and profile is not None):
-            profile_data_type=profile['header']['data_type']
-            if profile_data_type == PROFILE_DATA_TYPES.PROFILE:
-                numb = profile['points_count']
-
-            if 'points' in profile:
-                buf = "conveyor.txt"
-                arq = open(buf, "a")
-                for j in range(numb):
-                    msg = str(profile['points'][j].z) + "\n"
-                    arq.write(msg)
+        profiles = []
+        for _ in range(calibration_profiles):
+            profile = get_profile2D(scanner,zero_points,realtime,kSERVICE,as_numpy=True,as_object=True)
+            if profile is not None and profile.data_type == PROFILE_DATA_TYPES.PROFILE and 'points' in profile:
+                profiles.append(profile)
+
+        if profiles:
+            profile = profiles[0]
+            numb = min(p.points_count for p in profiles)
+
+            # Mean of every point over the profiles where the laser found the conveyor
+            x = np.stack([p.x[:numb] for p in profiles]).astype(np.float64)
+            z = np.stack([p.z[:numb] for p in profiles]).astype(np.float64)
+            valid = (x != 0) | (z != 0)
+            count = np.maximum(valid.sum(axis=0), 1)
+            x = np.where(valid, x, 0).sum(axis=0) / count
+            z = np.where(valid, z, 0).sum(axis=0) / count
+
+            # Each scanner has its own calibration, replaced on every run
+            buf = serialPath("conveyor.txt", profile.serial_number)
+            np.savetxt(buf, z[valid.any(axis=0)])
+
+            # Per-x baseline used to follow the shape of the conveyor
+            saveConveyorProfile(x, z, baselinePath(buf))
 
             #if 'intensity' in profile:
             #    for j in range(numb):
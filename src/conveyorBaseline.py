@@ -0,0 +1,173 @@
+"""
+#######################################################
+#                                                     #
+#   Conveyor baseline loaded from the calibration     #
+#   file generated by "Conveyor_Calibrating.py"       #
+#                                                     #
+#   The file is parsed once with NumPy and cached,    #
+#   it is only parsed again when its mtime or size    #
+#   changes (a new calibration replaces the file)     #
+#                                                     #
+#   The per-x baseline ("conveyor.npy") follows the   #
+#   shape of troughed belts and is subtracted from    #
+#   each profile with a single interpolation          #
+#                                                     #
+#   Each scanner has its own calibration files,       #
+#   "conveyor_<serial>.txt" and "conveyor_<serial>    #
+#   .npy", the shared files are the fallback          #
+#                                                     #
+#######################################################
+"""
+
+#######################################################
+#                                                     #
+#                      LIBRARIES                      #
+#                                                     #
+#######################################################
+import os, numpy as np
+from threading import Lock
+
+#######################################################
+#                                                     #
+#                    BASELINE CACHE                   #
+#                                                     #
+#######################################################
+_baseline_mutex = Lock()
+_baseline_cache = {}    # path: (mtime_ns, size, data)
+
+"""
+#################################################################################
+#                                                                               #
+#   Returns the data parsed from path by the parser function                    #
+#   The parser only runs again when the mtime or the size of path changes       #
+#                                                                               #
+#################################################################################
+"""
+def _loadCached(path, parser):
+    stat = os.stat(path)
+
+    with _baseline_mutex:
+        cached = _baseline_cache.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        data = parser(path)
+        _baseline_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+
+    return data
+
+"""
+#################################################################################
+#                                                                               #
+#   Returns the cached calibration of the conveyor stored in path               #
+#   The file is parsed again only if it was modified since the last call        #
+#   Returns a tuple (points, mean), points is a read-only array with every      #
+#   z value stored, mean is the mean height ignoring the zero readings          #
+#                                                                               #
+#################################################################################
+"""
+def _parseConveyorTxt(path):
+    points = np.loadtxt(path, dtype=np.float64, ndmin=1)
+    points.setflags(write=False)
+
+    valid = points[points != 0]
+    if valid.size == 0:
+        raise ValueError(f"No valid conveyor height found in {path}")
+
+    return points, float(valid.mean())
+
+def loadConveyorBaseline(path="conveyor.txt"):
+    return _loadCached(path, _parseConveyorTxt)
+
+"""
+#################################################################################
+#                                                                               #
+#   Calculates the mean height of a conveyor reading the "conveyor.txt" file    #
+#   The .txt file can be generated using the "Conveyor_Calibrating.py" program  #
+#   The mean height of conveyor is returned as a float value                    #
+#                                                                               #
+#################################################################################
+"""
+def getConveyorHeight(path="conveyor.txt"):
+    return loadConveyorBaseline(path)[1]
+
+"""
+#################################################################################
+#                                                                               #
+#   Returns every z value stored in the calibration file as a read-only array   #
+#                                                                               #
+#################################################################################
+"""
+def getConveyorPoints(path="conveyor.txt"):
+    return loadConveyorBaseline(path)[0]
+
+"""
+#################################################################################
+#                                                                               #
+#   Path of the calibration file of the scanner with the serial number,         #
+#   "conveyor.txt" becomes "conveyor_<serial>.txt"                              #
+#                                                                               #
+#################################################################################
+"""
+def serialPath(path, serial):
+    base, ext = os.path.splitext(path)
+    return f"{base}_{serial}{ext}"
+
+"""
+#################################################################################
+#                                                                               #
+#   Per-x conveyor baseline stored as a binary .npy file next to conveyor.txt   #
+#   It holds a (2, N) float64 array: row 0 are the x positions in increasing    #
+#   order and row 1 the conveyor height measured at each of them                #
+#                                                                               #
+#################################################################################
+"""
+def baselinePath(txt_path="conveyor.txt"):
+    return os.path.splitext(txt_path)[0] + ".npy"
+
+def saveConveyorProfile(x, z, path="conveyor.npy"):
+    x = np.asarray(x, dtype=np.float64)
+    z = np.asarray(z, dtype=np.float64)
+
+    # Zero points are positions where the laser found no surface
+    valid = (x != 0) | (z != 0)
+    if not valid.any():
+        raise ValueError("No valid point to store as conveyor baseline")
+    x, z = x[valid], z[valid]
+
+    order = np.argsort(x, kind="stable")
+    np.save(path, np.vstack((x[order], z[order])))
+
+def _parseConveyorNpy(path):
+    profile = np.load(path)
+    profile.setflags(write=False)
+    return profile
+
+def getConveyorProfile(path="conveyor.npy"):
+    return _loadCached(path, _parseConveyorNpy)
+
+"""
+#################################################################################
+#                                                                               #
+#   Subtracts the conveyor height from the z values of points placed at x       #
+#   The per-x baseline is interpolated onto x when it exists, otherwise the     #
+#   mean height of "conveyor.txt" is used                                       #
+#   The files of the scanner with the serial number are used before the         #
+#   shared files                                                                #
+#                                                                               #
+#################################################################################
+"""
+def subtractConveyorBaseline(x, z, serial=None, txt_path="conveyor.txt"):
+    txt_paths = [txt_path] if serial is None else [serialPath(txt_path, serial), txt_path]
+
+    for path in txt_paths:
+        npy_path = baselinePath(path)
+        if os.path.exists(npy_path):
+            baseline_x, baseline_z = getConveyorProfile(npy_path)
+            return np.asarray(z) - np.interp(x, baseline_x, baseline_z)
+
+    for path in txt_paths[:-1]:
+        if os.path.exists(path):
+            return np.asarray(z) - getConveyorHeight(path)
+
+    return np.asarray(z) - getConveyorHeight(txt_path)
@@ -0,0 +1,105 @@
+"""
+#######################################################
+#                                                     #
+#   On-disk cache of the scanners discovered          #
+#                                                     #
+#   The serial, IP, MAC, firmware and get_info of     #
+#   every scanner are stored in a JSON file. On       #
+#   restart the cached IPs are searched directly,     #
+#   the broadcast on every adapter is only made when  #
+#   some cached scanner is not found                  #
+#                                                     #
+#######################################################
+"""
+
+#######################################################
+#                                                     #
+#                      LIBRARIES                      #
+#                                                     #
+#######################################################
+import json, os
+from PYSDK_SMART import *
+
+CACHE_FILE = "scanners.json"
+
+"""
+#################################################################################
+#                                                                               #
+#   Returns the entries stored in path, a list of dicts with serial, ip, mac,   #
+#   firmware and info. A missing or unreadable file is an empty cache, and      #
+#   entries without an integer serial and an IPv4 ip are dropped                #
+#                                                                               #
+#################################################################################
+"""
+def _validEntry(entry):
+    return (isinstance(entry, dict)
+            and isinstance(entry.get('serial'), int) and not isinstance(entry.get('serial'), bool)
+            and is_ipv4(entry.get('ip')))
+
+def loadDiscoveryCache(path=CACHE_FILE):
+    try:
+        with open(path, "r") as arq:
+            entries = json.load(arq)
+    except (OSError, ValueError):
+        return []
+
+    if not isinstance(entries, list):
+        return []
+    return [entry for entry in entries if _validEntry(entry)]
+
+"""
+#################################################################################
+#                                                                               #
+#   Stores get_info of every scanner in path                                    #
+#   The file is replaced atomically so a crash never leaves it half written     #
+#                                                                               #
+#################################################################################
+"""
+def saveDiscoveryCache(scanners, path=CACHE_FILE, protocol=kSERVICE):
+    entries = []
+    for scanner in scanners:
+        info = get_info(scanner, protocol)
+        if not info:
+            continue
+        entries.append({
+            'serial': info['fact_general_serial'],
+            'ip': info['user_network_ip'],
+            'mac': info['fact_network_macAddr'],
+            'firmware': info['firmware_version'],
+            'info': info,
+        })
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as arq:
+        json.dump(entries, arq, indent=2, default=str)
+    os.replace(temp_path, path)
+    return entries
+
+"""
+#################################################################################
+#                                                                               #
+#   Searches the scanners of the cache directly by their IPs and returns as     #
+#   soon as all of them are found. Falls back to the broadcast search when      #
+#   the cache is empty or some cached scanner is not found                      #
+#   Returns the scanners, the latency of each adapter and True if the cache     #
+#   was enough                                                                  #
+#   parallel probes the cached IPs of an adapter concurrently                   #
+#                                                                               #
+#################################################################################
+"""
+def discoverCached(path=CACHE_FILE, timeout=300, protocol=kSERVICE, parallel=False):
+    entries = loadDiscoveryCache(path)
+
+    if entries:
+        serials = [entry['serial'] for entry in entries]
+        scanners, latency = discover(timeout, protocol, [entry['ip'] for entry in entries], serials, parallel)
+        found = set()
+        for scanner in scanners:
+            info = get_info(scanner, protocol)
+            if info:
+                found.add(info['fact_general_serial'])
+        if set(serials) <= found:
+            return scanners, latency, True
+
+    scanners, latency = discover(timeout, protocol)
+    return scanners, latency, False
@@ -0,0 +1,47 @@
+"""
+#######################################################
+#                                                     #
+#   Import time of the SDK modules                    #
+#                                                     #
+#   Each import runs in a fresh interpreter, the      #
+#   median of the runs minus the startup time of an   #
+#   empty interpreter is reported                     #
+#                                                     #
+#   python importBenchmark.py [runs]                  #
+#                                                     #
+#######################################################
+"""
+
+#######################################################
+#                                                     #
+#                      LIBRARIES                      #
+#                                                     #
+#######################################################
+import os, statistics, subprocess, sys, time
+
+MODULES = ["PYSDK_SMART_types", "PYSDK_SMART"]
+
+def timeImport(statement, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    startup = timeImport("pass", runs)
+    print(f"Interpreter startup: {startup * 1000:.1f} ms")
+
+    for module in MODULES:
+        elapsed = timeImport(f"import {module}", runs) - startup
+        print(f"import {module}: {elapsed * 1000:.1f} ms")
+
+    # The native library is only loaded on the first call to the sdk
+    try:
+        elapsed = timeImport("import PYSDK_SMART; PYSDK_SMART.load_sdk()", runs) - startup
+        print(f"import PYSDK_SMART + load_sdk(): {elapsed * 1000:.1f} ms")
+    except subprocess.CalledProcessError:
+        print("load_sdk() failed, set RF62X_SDK_PATH to the path of the sdk library")
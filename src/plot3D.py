@@ -16,48 +16,21 @@
 #                      LIBRARIES                      #
 #                                                     #
 #######################################################
-import credentials, sys, time, psycopg2, matplotlib.pyplot as plt, numpy as np
+import atexit, credentials, sys, time, psycopg2, matplotlib.pyplot as plt, numpy as np
 from datetime import datetime, timezone
 from PYSDK_SMART import *
+from conveyorBaseline import subtractConveyorBaseline
+from scannerSession import ScannerSession
+from profileCapture import RollingCapture, captureConcurrently, captureDump, captureProfiles
+from surfaceArchive import archiveSurface
 from matplotlib import cm
 from mpl_toolkits.mplot3d import Axes3D
-from scipy import interpolate
 
 #######################################################
 #                                                     #
 #                  GLOBAL FUNCTIONS                   #
 #                                                     #
 #######################################################
-"""
-#################################################################################
-#                                                                               #
-#   Calculates the mean height of a conveyor reading the "conveyor.txt" file    #
-#   The .txt file can be generated using the "Conveyor_Calibrating.py" program	#
-#   The mean height of conveyor is returned as a float value                    #
-#                                                                               #
-#################################################################################
-"""
-def getConveyorHeight():
-    my_file = open("conveyor.txt", "r")
-
-    content_list = my_file.readlines()
-    h_conveyor_sum = 0
-    count = 0
-
-    for line in content_list:
-        content_z = float(line)
-
-        if (content_z == 0):
-            pass
-
-        else:
-            h_conveyor_sum = h_conveyor_sum + content_z
-            count = count + 1
-
-    h_conveyor_mean = h_conveyor_sum/count
-
-    return h_conveyor_mean
-
 """
 #################################################################################
 #                                                                               #
@@ -94,6 +67,238 @@ def closeDB(db):
 def now():
     return datetime.now(timezone.utc).replace(tzinfo=None)
 
+"""
+#################################################################################
+#                                                                               #
+#   Builds the X, Y and Z matrices of the 3D surface from a list of profiles    #
+#   The conveyor baseline of the scanner is subtracted from every point,        #
+#   heights below min_height are set to 0 and the points where the laser        #
+#   found no surface repeat the last valid reading (the first valid reading     #
+#   for the points before it). Y is measured from the pulse count step_origin,  #
+#   by default the pulse count of the first profile                             #
+#   Returns X, Y, Z shaped (profiles, points) in centimeters                    #
+#                                                                               #
+#################################################################################
+"""
+def buildSurface(dump, pulse_to_mm=0.05, mm_to_cm=0.1, min_height=0.21, step_origin=None):
+    return fillSurface(*profilePoints(dump, mm_to_cm, min_height), pulse_to_mm, mm_to_cm, step_origin)
+
+"""
+#################################################################################
+#                                                                               #
+#   First step of buildSurface, converts the profiles of one scanner            #
+#   The points of consecutive chunks of a dump can be converted while the       #
+#   next chunk is downloaded, then joined with np.concatenate                   #
+#   Returns X and Z in centimeters, the pulse count of each profile and the     #
+#   mask of the points where the laser found a surface                          #
+#                                                                               #
+#################################################################################
+"""
+def profilePoints(dump, mm_to_cm=0.1, min_height=0.21):
+    dump = [profile for profile in dump if profile.points is not None]
+    points_numb = dump[0].points_count
+
+    # Each point is a (x, z) pair of float32
+    points = np.stack([np.frombuffer(profile.points, dtype=np.float32, count=2*points_numb) for profile in dump])
+    x = points[:, 0::2]
+    z = points[:, 1::2]
+    steps = np.array([profile.step_count for profile in dump], dtype=np.int64)
+
+    valid = (x != 0) | (z != 0)
+    X = np.where(valid, x * mm_to_cm, 0)
+    Z = np.where(valid, subtractConveyorBaseline(x, z, dump[0].serial_number) * mm_to_cm, 0)
+    Z[Z < min_height] = 0
+
+    return X, Z, steps, valid
+
+"""
+#################################################################################
+#                                                                               #
+#   Second step of buildSurface, places the profiles along the belt and fills   #
+#   the points where the laser found no surface                                 #
+#                                                                               #
+#################################################################################
+"""
+def fillSurface(X, Z, steps, valid, pulse_to_mm=0.05, mm_to_cm=0.1, step_origin=None):
+    points_numb = X.shape[1]
+
+    # Distance of each profile to the origin
+    step_origin = steps[0] if step_origin is None else step_origin
+    Y = np.repeat(((steps - step_origin) * pulse_to_mm * mm_to_cm)[:, np.newaxis], points_numb, axis=1)
+
+    flat_valid = valid.ravel()
+    if flat_valid.any():
+        last_valid = np.where(flat_valid, np.arange(flat_valid.size), -1)
+        last_valid = np.maximum.accumulate(last_valid)
+        last_valid[last_valid < 0] = np.argmax(flat_valid)
+        X = X.ravel()[last_valid].reshape(X.shape)
+        Z = Z.ravel()[last_valid].reshape(Z.shape)
+
+    return X, Y, Z
+
+"""
+#################################################################################
+#                                                                               #
+#   Linear interpolation of every row of fp, sampled at the positions xp of     #
+#   the same row, onto the common positions x, without a Python loop            #
+#   Each row of xp must be in increasing order. Rows are placed one after the   #
+#   other on a single axis so one searchsorted finds all neighbours             #
+#   Positions outside the range of a row get the value outside                  #
+#                                                                               #
+#################################################################################
+"""
+def interpRows(xp, fp, x, outside=0.0):
+    rows, points = xp.shape
+    base = min(xp.min(), x.min())
+    width = max(xp.max(), x.max()) - base + 1
+    offset = (np.arange(rows) * width)[:, np.newaxis]
+
+    keys = (xp - base + offset).ravel()
+    query = (x - base)[np.newaxis, :] + offset
+    left = np.searchsorted(keys, query.ravel(), side='right').reshape(query.shape) - 1
+    left = np.clip(left - np.arange(rows)[:, np.newaxis] * points, 0, points - 2)
+
+    row = np.arange(rows)[:, np.newaxis]
+    x0, x1 = xp[row, left], xp[row, left + 1]
+    f0, f1 = fp[row, left], fp[row, left + 1]
+    dx = x1 - x0
+    t = np.divide(x - x0, dx, out=np.zeros(dx.shape), where=dx != 0)
+    values = f0 + np.clip(t, 0, 1) * (f1 - f0)
+
+    inside = (x >= xp[:, :1]) & (x <= xp[:, -1:])
+    return np.where(inside, values, outside)
+
+"""
+#################################################################################
+#                                                                               #
+#   Resamples the 3D surface onto a regular grid with x_step and y_step (cm)    #
+#   Each profile is interpolated onto the x grid, then the profiles are         #
+#   interpolated onto the y grid, x_range and y_range default to the extent     #
+#   of the surface. Heights outside the range measured are set to 0             #
+#   Returns Xg, Yg, Zg shaped (len(y grid), len(x grid))                        #
+#                                                                               #
+#################################################################################
+"""
+def resampleSurface(X, Y, Z, x_step=0.1, y_step=0.5, x_range=None, y_range=None):
+    x_min, x_max = x_range if x_range is not None else (X.min(), X.max())
+    y_min, y_max = y_range if y_range is not None else (Y.min(), Y.max())
+    x_grid = x_min + np.arange(int(np.floor((x_max - x_min) / x_step)) + 1) * x_step
+    y_grid = y_min + np.arange(int(np.floor((y_max - y_min) / y_step)) + 1) * y_step
+
+    # Profiles onto the x grid, points sorted by x in each profile
+    if X.shape[1] > 1:
+        order = np.argsort(X, axis=1, kind='stable')
+        Z_rows = interpRows(np.take_along_axis(X, order, axis=1), np.take_along_axis(Z, order, axis=1), x_grid)
+    else:
+        Z_rows = np.zeros((X.shape[0], x_grid.size))
+
+    # Profiles onto the y grid, all points of a profile share its y position
+    if X.shape[0] > 1:
+        order = np.argsort(Y[:, 0], kind='stable')
+        y_rows = np.broadcast_to(Y[order, 0], (x_grid.size, Y.shape[0]))
+        Zg = interpRows(y_rows, Z_rows[order].T, y_grid).T
+    else:
+        Zg = np.zeros((y_grid.size, x_grid.size))
+
+    Xg, Yg = np.meshgrid(x_grid, y_grid)
+    return Xg, Yg, Zg
+
+"""
+#################################################################################
+#                                                                               #
+#   Stitches the surfaces of adjacent heads into one wide surface               #
+#   x_offsets are the positions (cm) of each head across the belt, every        #
+#   surface is resampled onto the same regular grid and where heads overlap     #
+#   the highest reading is kept                                                 #
+#   The Y of all surfaces must be measured from the same pulse count            #
+#                                                                               #
+#################################################################################
+"""
+def stitchSurfaces(surfaces, x_offsets, x_step=0.1, y_step=0.5):
+    shifted = [(X + offset, Y, Z) for (X, Y, Z), offset in zip(surfaces, x_offsets)]
+    x_range = (min(X.min() for X, _, _ in shifted), max(X.max() for X, _, _ in shifted))
+    y_range = (min(Y.min() for _, Y, _ in shifted), max(Y.max() for _, Y, _ in shifted))
+
+    Zg = None
+    for X, Y, Z in shifted:
+        Xg, Yg, Z_head = resampleSurface(X, Y, Z, x_step, y_step, x_range, y_range)
+        Zg = Z_head if Zg is None else np.maximum(Zg, Z_head)
+
+    return Xg, Yg, Zg
+
+"""
+#################################################################################
+#                                                                               #
+#   Calculates the volume under the 3D surface with the trapezoidal rule        #
+#   The area of each profile is integrated along its own x positions and the    #
+#   areas are integrated along the irregular y positions given by the pulses    #
+#   Points are sorted by x in each profile (the points filled by buildSurface   #
+#   may repeat the last point of the previous profile) and profiles by y        #
+#   X, Y and Z must be in centimeters, the volume is returned in m³             #
+#                                                                               #
+#################################################################################
+"""
+def calcSurfaceVolume(X, Y, Z):
+    cm3_to_m3 = 0.000001 # Converts cm³ to m³
+
+    if Z.shape[0] < 2 or Z.shape[1] < 2:
+        return 0
+
+    order = np.argsort(X, axis=1, kind='stable')
+    X = np.take_along_axis(X, order, axis=1)
+    Z = np.take_along_axis(Z, order, axis=1)
+    areas = 0.5 * np.sum((Z[:, 1:] + Z[:, :-1]) * np.diff(X, axis=1), axis=1) # cm² of each profile
+
+    order = np.argsort(Y[:, 0], kind='stable')
+    areas = areas[order]
+    volume = 0.5 * np.sum((areas[1:] + areas[:-1]) * np.diff(Y[order, 0])) # cm³
+
+    return float(volume) * cm3_to_m3
+
+"""
+#################################################################################
+#                                                                               #
+#   Renders a perspective view of the 3D surface with matplotlib 3D axes        #
+#   It costs seconds of CPU per image, so it runs only every few captures       #
+#                                                                               #
+#################################################################################
+"""
+PERSPECTIVE_VIEWS = {       # name: (elevation, azimuth)
+    'standard': (30, -60),
+    'side': (30, 60),
+    'front': (0, 0),
+}
+
+def renderPerspective(X, Y, Z, save_path, elev, azim):
+    fig1 = plt.figure(figsize=(16, 9))#figsize=(4,4))
+    ax1 = fig1.add_subplot(111, projection='3d')
+    #ax.plot_wireframe(X, Y, Z,cmap=cm.hot)
+    ax1.plot_surface(X, Y, Z, cmap=cm.hot, linewidth=1, antialiased=True)
+    ax1.set_xlim(-10, 10)
+    #ax1.set_ylim(100, 125)
+    ax1.set_zlim(0, 10)
+    ax1.view_init(elev, azim)
+    #plt.axis('off')
+    plt.savefig(save_path, dpi=300, bbox_inches="tight", pad_inches=0)
+    plt.close(fig1)
+
+"""
+#################################################################################
+#                                                                               #
+#   Fast top-down heightmap of the belt, rendered without matplotlib 3D axes    #
+#   Each Z value is mapped to an RGB color through a precomputed lookup table   #
+#   built from the cm.hot palette, then the image is written straight to PNG    #
+#                                                                               #
+#################################################################################
+"""
+HEIGHTMAP_LUT = (cm.hot(np.linspace(0, 1, 256))[:, :3] * 255).astype(np.uint8)
+
+def renderHeightmap(Z, save_path, z_min=0, z_max=10, lut=HEIGHTMAP_LUT):
+    levels = len(lut) - 1
+    Z = np.nan_to_num(np.asarray(Z, dtype=np.float32))
+    index = ((np.clip(Z, z_min, z_max) - z_min) * (levels / (z_max - z_min))).astype(np.uint8)
+    plt.imsave(save_path, lut[index], origin='lower')
+
 #######################################################
 #                                                     #
 #                        MAIN                         #
@@ -108,6 +313,55 @@ if __name__ == '__main__':
     _user= credentials.postgres_user
     _pass= credentials.postgres_pass
 
+    grid_x_step = 0.1                   # Resolution of the regular grid across the belt (cm)
+    grid_y_step = 0.5                   # Resolution of the regular grid along the belt (cm)
+    perspective_every = 6               # Renders the 3D perspective views once every N captures (0 disables them)
+    capture_counts = {}                 # Number of captures processed since start, by scanner serial
+    perspective_imgs = {}               # Last perspective images by scanner serial, kept until rendered again
+    streaming = '--stream' in sys.argv  # Acquires profiles continuously instead of "wait 10 s, capture 5 s"
+    stream_window = 10                  # Seconds of profiles kept by each rolling capture
+    dumping = '--dump' in sys.argv      # Records profiles at full rate in the sensor memory, then downloads them
+    dump_profiles = 5000                # Profiles recorded by each dump capture
+    dump_chunk_size = 1000              # Profiles downloaded at a time from the dump memory
+    dump_timeout = 30                   # Seconds to wait for the dump memory to be full
+    captures = []                       # Rolling capture of each scanner in streaming mode
+    stitching = '--stitch' in sys.argv  # Stitches the surfaces of adjacent heads into one wide surface
+    # Position across the belt (cm) of each head by serial number, used to stitch
+    # Set in credentials.py as head_offsets = {serial: offset, ...}
+    head_offsets = {int(serial): float(offset) for serial, offset in getattr(credentials, "head_offsets", {}).items()}
+    archive_path = f"{credentials.device_path}archive/" # Compressed X, Y, Z of every surface captured
+
+    ###### Initialize sdk library and connect to the scanners only once ######
+    session = ScannerSession(cache_path="scanners.json")
+
+    # The capture of a scanner is stopped before the session reconnects or releases it
+    def stopCapture(scanner):
+        for capture in captures:
+            if capture.scanner is scanner:
+                capture.stop()
+
+    def closeSession():
+        for capture in captures:
+            capture.stop()
+        session.close()
+
+    session.release_callbacks.append(stopCapture)
+    streamed_scanners = session.open()
+    atexit.register(closeSession)
+
+    if streaming:
+        captures = [RollingCapture(scanner, stream_window).start() for scanner in streamed_scanners]
+
+    ###### Tables created before the heightmap view and the volume existed ######
+    # Runs once, the alter locks the table against the Grafana readers
+    db = startDB(_host, _port, _db, _user, _pass)
+    try:
+        sql = 'alter table plot add column if not exists heightmap_view VARCHAR(100), add column if not exists volume REAL;'
+        createInsertDB(db, sql)
+    except psycopg2.Error:
+        pass    # No table yet, it is created with every column in the loop
+    closeDB(db)
+
     init = now()
 
     while True:
@@ -123,25 +377,11 @@ if __name__ == '__main__':
             ############### Main Variables ################
             zero_points=True
             realtime=True
-            profiles_numb = 0                   # Number of profiles received
-            points_numb = 0                     # Number of points in each profile
-            h_conveyor = getConveyorHeight()    # Conveyor Height to calibrate measures
-            last_lecture_x = 0                  # Last x coordinate stored
-            last_lecture_z = 0                  # Last z coordinate stored
-            y = 0                               # Initial y coordinate value
-            last_pulse_count = 0                # Last Pulse count received from the last profile
-            delta_y = 0                         # Difference between 2 profiles in milimeters
-            flag_0 = False                      # Returns True when a non zero height value is found
-            X = []	                            # Matrice X for 3D Surface
-            Y = []	                            # Matrice Y for 3D Surface
-            Z = []	                            # Matrice Z for 3D Surface
-            dump = []                           # Stores profile readings
-            timestamp = []                      # Stores timestamp
+            surfaces = []                       # (serial number, first pulse count, X, Y, Z) of each scanner
             id = 1                              # Last ID stored in Metrics Database
             pulse_to_mm = 0.05                  # Converts each pulse to value in milimeters
             mm_to_cm = 0.1                      # Converts mm to m
             total_time_reading = 5              # Total time reading profiles from sensor
-            delta_time_reading = 0              # Delta time reading profiles from sensor
 
             #######################################################
             #                                                     #
@@ -159,15 +399,23 @@ if __name__ == '__main__':
             except:
                 closeDB(db)
                 db = startDB(_host, _port, _db, _user, _pass)
-                sql = 'create table plot(id SERIAL primary key, standard_view VARCHAR(100), front_view VARCHAR(100), side_view VARCHAR(100));'
+                sql = 'create table plot(id SERIAL primary key, standard_view VARCHAR(100), front_view VARCHAR(100), side_view VARCHAR(100), heightmap_view VARCHAR(100), volume REAL);'
                 createInsertDB(db, sql)
                 closeDB(db)
 
-            ############# Initialize sdk library ############
-            sdk_init()
+            ### Get connected scanners, reconnecting the ones lost ###
+            list_scanners = session.ensureConnected()
 
-            ######### Get scanner from scanners list ########
-            list_scanners=search()
+            ###### Restart the rolling captures when the scanners changed ######
+            if streaming and list_scanners is not streamed_scanners:
+                for capture in captures:
+                    capture.stop()
+                captures = [RollingCapture(scanner, stream_window, zero_points, realtime).start() for scanner in list_scanners]
+                streamed_scanners = list_scanners
+            elif streaming:
+                # Captures stopped while their scanner was reconnected in place
+                for capture in captures:
+                    capture.start()
 
             #################################################
             #                                               #
@@ -179,159 +427,100 @@ if __name__ == '__main__':
 
             #################################################
             #                                               #
-            #           VERIFY SENSOR CONNECTION            #
+            #   GET PROFILES FROM ALL SENSORS IN THE SAME   #
+            #   TIME WINDOW                                 #
             #                                               #
             #################################################
-            for scanner in list_scanners:
+            init_time_read = now()
+            ###### Get profile from scanner's data stream by Service Protocol ######
 
-                ##### Establish connection to the RF627 device by Service Protocol #####
-                is_connected = connect(scanner)
-                if (not is_connected):
-                    print("Failed to connect to scanner!")
-                    continue
+            if streaming: # SNAPSHOT OF THE ROLLING WINDOWS, ACQUISITION KEEPS RUNNING
+                captured = [(capture.snapshot(), capture.takeStats()) for capture in captures]
 
-        	    #################################################
-        	    #                                               #
-        	    #           GET PROFILES FROM SENSOR            #
-        	    #                                               #
-        	    #################################################
-                init_time_read = now()
-                ###### Get profile from scanner's data stream by Service Protocol ######
-
-                while delta_time_reading <= total_time_reading: # GETTING PROFILES FROM SENSOR
-                    profile = get_profile2D(scanner,zero_points,realtime,kSERVICE)
-                    if (profile is not None):
-                        profiles_numb = profiles_numb + 1
-                        dump.append(profile) # Get 2D Profile from Sensor
-                    # Calculating delta time
-                    diff = now() - init_time_read
-                    delta_time_reading = diff.total_seconds()
-
-        	    #################################################
-        	    #                                               #
-        	    #             PROFILES PROCESSING               #
-        	    #                                               #
-        	    #################################################
-                last_pulse_count = dump[0]['header']['step_count']
-                points_numb = dump[0]['points_count']
-
-                for profile in dump:
-                    # SETUP FOR EACH PROFILE
-                    current_pulse_count = profile['header']['step_count']
-
-                    # Calculating distance between 2 profiles
-                    delta_y = (current_pulse_count - last_pulse_count) * pulse_to_mm * mm_to_cm
-
-                    # Calculating distance between 2 profiles
-                    y = y + delta_y
-
-                    ##### REFRESH VALUES #####
-                    last_pulse_count = current_pulse_count
-
-                    if 'points' in profile:
-                        for j in range(points_numb):
-                            content_x = float(profile['points'][j].x)
-                            content_z = float(profile['points'][j].z)
-
-                            if ((content_x == 0 and content_z== 0)):
-                                if(flag_0 == False):
-                                    X.append(content_x)
-                                    Z.append(content_z)
-
-                                else: # Flag 0 is True, it means there is a non NULL height value stored in last_lecture variables
-                                    X.append(last_lecture_x)
-                                    Z.append(last_lecture_z)
-
-                            else:
-                                last_lecture_x = content_x/10
-                                last_lecture_z = (content_z - h_conveyor)/10
-
-                                if last_lecture_z < 0.21:
-                                    last_lecture_z = 0
-
-                                X.append(last_lecture_x)
-                                Z.append(last_lecture_z)
-
-                                if(flag_0 == False):
-                                    flag_0 = True
-
-                                    for i in range(j-1, -1, -1):
-                                        X[i] = last_lecture_x
-                                        Z[i] = last_lecture_z
-
-                            Y.append(y)
+            elif dumping: # BURST CAPTURE IN THE SENSOR DUMP MEMORY
+                # The points of each chunk are converted while the next chunk is downloaded
+                chunk_points = {}   # serial number: profilePoints of each chunk
+                def convertChunk(chunk):
+                    if any(profile.points is not None for profile in chunk):
+                        chunk_points.setdefault(chunk[0].serial_number, []).append(profilePoints(chunk, mm_to_cm))
 
-                #######################################################
-                #                                                     #
-                #              RESHAPING VECTORS TO PLOT              #
-                #                                                     #
-                #######################################################
-                X = np.reshape(X,(profiles_numb, points_numb))
-                Y = np.reshape(Y,(profiles_numb, points_numb))
-                Z = np.reshape(Z,(profiles_numb, points_numb))
-                
-                #tck = interpolate.bisplrep(X, Y, Z, s=0)
-                #Znew = interpolate.bisplev(X[:,0], Y[0,:], tck)
-                
-                #######################################################
-                #                                                     #
-                #               SAVING STANDARD.PNG IMAGE             #
-                #                                                     #
-                #######################################################
-                fig1 = plt.figure(figsize=(16, 9))#figsize=(4,4))
-                ax1 = fig1.add_subplot(111, projection='3d')
-                #ax.plot_wireframe(X, Y, Z,cmap=cm.hot)
-                surf = ax1.plot_surface(X, Y, Z, cmap=cm.hot, linewidth=1, antialiased=True)
-                ax1.set_xlim(-10, 10)
-                #ax1.set_ylim(100, 125)
-                ax1.set_zlim(0, 10)
-                ax1.view_init(30,-60)
-                #plt.axis('off')
-                save_path = f"{credentials.device_path}standard{id}.png"
-                db_path = f"{credentials.grafana_path}standard{id}.png"
-                plt.savefig(save_path, dpi=300, bbox_inches="tight", pad_inches=0)
-                standard_img = '<img width="100%c" src="%s">' % ('%', db_path)
-                plt.close(fig1)
+                captured = captureConcurrently(list_scanners, captureDump, dump_profiles, dump_chunk_size, dump_timeout, convertChunk)
+
+            else: # GETTING PROFILES FROM SENSOR
+                captured = captureConcurrently(list_scanners, captureProfiles, total_time_reading, zero_points, realtime, kSERVICE)
+
+            #################################################
+            #                                               #
+            #             PROFILES PROCESSING               #
+            #                                               #
+            #################################################
+            dumps = []
+            for dump, stats in captured:
+                print(stats.report())
+                if len(dump) == 0:
+                    print("No profile received from scanner!")
+                    continue
+                dumps.append(dump)
+
+            # Pulse count shared by every surface, so stitched heads stay aligned along the belt
+            step_origin = min((dump[0].step_count for dump in dumps), default=None) if stitching else None
+
+            for dump in dumps:
+                ######## Matrices X, Y and Z for 3D Surface #########
+                if dumping:
+                    X, Z, steps, valid = (np.concatenate(arrays) for arrays in zip(*chunk_points[dump[0].serial_number]))
+                    X, Y, Z = fillSurface(X, Z, steps, valid, pulse_to_mm, mm_to_cm, step_origin)
+                else:
+                    X, Y, Z = buildSurface(dump, pulse_to_mm, mm_to_cm, step_origin=step_origin)
+                surfaces.append((dump[0].serial_number, dump[0].step_count, X, Y, Z))
+
+            ###### Surfaces resampled onto a regular grid, stitched or one per scanner ######
+            missing = [serial for serial, _, _, _, _ in surfaces if serial not in head_offsets]
+            if stitching and len(surfaces) > 1 and missing:
+                print(f"Not stitching, no offset in credentials.head_offsets for the heads: {missing}")
+
+            if stitching and len(surfaces) > 1 and not missing:
+                offsets = [head_offsets[serial] for serial, _, _, _, _ in surfaces]
+                Xg, Yg, Zg = stitchSurfaces([(X, Y, Z) for _, _, X, Y, Z in surfaces], offsets, grid_x_step, grid_y_step)
+                serials = [serial for serial, _, _, _, _ in surfaces]
+                results = [(serials, min(step for _, step, _, _, _ in surfaces), Xg, Yg, Zg, Xg, Yg, Zg)]
+            else:
+                results = [(serial, step, X, Y, Z) + resampleSurface(X, Y, Z, grid_x_step, grid_y_step) for serial, step, X, Y, Z in surfaces]
+
+            for serial, belt_position, X, Y, Z, Xg, Yg, Zg in results:
+                # Stitched surfaces are keyed by the serials of all their heads
+                head = tuple(serial) if isinstance(serial, list) else serial
+                capture_count = capture_counts.get(head, 0)
+                head_imgs = perspective_imgs.setdefault(head, {view: '' for view in PERSPECTIVE_VIEWS})
+
+                ###### Volume of the capture window in m³ ######
+                volume = calcSurfaceVolume(X, Y, Z)
+
+                ######## Archive surface for later analysis #########
+                archiveSurface(archive_path, id, X, Y, Z, init_time_read, belt_position, scanner=serial, volume=volume)
 
                 #######################################################
                 #                                                     #
-                #                 SAVING SIDE.PNG IMAGE               #
+                #               SAVING HEIGHTMAP.PNG IMAGE            #
                 #                                                     #
                 #######################################################
-                fig1 = plt.figure(figsize=(16, 9))#figsize=(4,4))
-                ax1 = fig1.add_subplot(111, projection='3d')
-                #ax.plot_wireframe(X, Y, Z,cmap=cm.hot)
-                surf = ax1.plot_surface(X, Y, Z, cmap=cm.hot, linewidth=1, antialiased=True)
-                ax1.set_xlim(-10, 10)
-                #ax1.set_ylim(100, 125)
-                ax1.set_zlim(0, 10)
-                ax1.view_init(30, 60)
-                #plt.axis('off')
-                save_path = f"{credentials.device_path}side{id}.png"
-                db_path = f"{credentials.grafana_path}side{id}.png"
-                plt.savefig(save_path, dpi=300, bbox_inches="tight", pad_inches=0)
-                side_img = '<img width="100%c" src="%s">' % ('%', db_path)
-                plt.close(fig1)
+                save_path = f"{credentials.device_path}heightmap{id}.png"
+                db_path = f"{credentials.grafana_path}heightmap{id}.png"
+                renderHeightmap(Zg, save_path)
+                heightmap_img = '<img width="100%c" src="%s">' % ('%', db_path)
 
                 #######################################################
                 #                                                     #
-                #               SAVING FRONT.PNG IMAGE                #
+                #     SAVING STANDARD, SIDE AND FRONT.PNG IMAGES      #
                 #                                                     #
                 #######################################################
-                fig1 = plt.figure(figsize=(16, 9))#figsize=(4,4))
-                ax1 = fig1.add_subplot(111, projection='3d')
-                #ax.plot_wireframe(X, Y, Z,cmap=cm.hot)
-                surf = ax1.plot_surface(X, Y, Z, cmap=cm.hot, linewidth=1, antialiased=True)
-                ax1.set_xlim(-10, 10)
-                #ax1.set_ylim(100, 125)
-                ax1.set_zlim(0, 10)
-                #plt.axis('off')
-                ax1.view_init(0, 0)
-                save_path = f"{credentials.device_path}front{id}.png"
-                db_path = f"{credentials.grafana_path}front{id}.png"
-                plt.savefig(save_path, dpi=300, bbox_inches="tight", pad_inches=0)
-                front_img = '<img width="100%c" src="%s">' % ('%', db_path)
-                plt.close(fig1)
+                if perspective_every > 0 and capture_count % perspective_every == 0:
+                    for view, (elev, azim) in PERSPECTIVE_VIEWS.items():
+                        save_path = f"{credentials.device_path}{view}{id}.png"
+                        db_path = f"{credentials.grafana_path}{view}{id}.png"
+                        renderPerspective(Xg, Yg, Zg, save_path, elev, azim)
+                        head_imgs[view] = '<img width="100%c" src="%s">' % ('%', db_path)
+                capture_counts[head] = capture_count + 1
 
                 #######################################################
                 #                                                     #
@@ -339,21 +528,16 @@ if __name__ == '__main__':
                 #                                                     #
                 #######################################################
                 db = startDB(_host, _port, _db, _user, _pass)
-                sql = f"insert into plot values (default, '{standard_img}', '{front_img}', '{side_img}')"
+                sql = f"insert into plot (standard_view, front_view, side_view, heightmap_view, volume) values ('{head_imgs['standard']}', '{head_imgs['front']}', '{head_imgs['side']}', '{heightmap_img}', '{volume}')"
                 createInsertDB(db, sql)
                 closeDB(db)
 
-                #################################################
-                #                                               #
-                #           DISCONNECT SENSOR AND SDK           #
-                #                                               #
-                #################################################
-
-                ######### Disconnect from scanner #########
-                disconnect(scanner)
-
-            ######### Cleanup resources allocated with sdk_init() #########
-            sdk_cleanup()
+                # Next row of the plot table
+                id = id + 1
 
             ##### REFRESH VALUES #####
             init = now()
+
+        else:
+            # Leaves the interpreter to the acquisition threads while waiting
+            time.sleep(0.05)
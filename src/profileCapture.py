@@ -0,0 +1,318 @@
+"""
+#######################################################
+#                                                     #
+#   Profile acquisition from RF627 SMART scanners     #
+#                                                     #
+#   RollingCapture keeps acquiring 2D profiles in a   #
+#   background thread and stores the last seconds     #
+#   in a rolling buffer, snapshots of this window     #
+#   can be taken without pausing the acquisition      #
+#                                                     #
+#   captureDump records profiles in the memory of     #
+#   the sensor at full rate, then downloads them in   #
+#   chunks while the previous chunk is processed      #
+#                                                     #
+#   Profiles repeating the measure_count of the       #
+#   previous one are dropped as duplicates            #
+#                                                     #
+#   ProfileProducer requests profiles in its own      #
+#   thread (the sdk call releases the GIL) into a     #
+#   bounded queue, consumers convert them meanwhile   #
+#                                                     #
+#   Profiles are returned as PYSDK_SMART.Profile      #
+#   objects, the header is decoded with a single      #
+#   struct unpack and read as attributes              #
+#                                                     #
+#######################################################
+"""
+
+#######################################################
+#                                                     #
+#                      LIBRARIES                      #
+#                                                     #
+#######################################################
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread
+from PYSDK_SMART import *
+
+MEASURE_COUNT_MODULO = 2**32    # measure_count is an uint32 in the profile header
+
+"""
+#################################################################################
+#                                                                               #
+#   Counts the profiles of a capture and filters the duplicates                 #
+#   In realtime mode get_profile2D may return the same measurement again when   #
+#   it is called faster than the sensor produces profiles, these repeat the     #
+#   measure_count of the previous profile. Jumps in measure_count are counted   #
+#   as profiles missed by the capture                                           #
+#                                                                               #
+#################################################################################
+"""
+class CaptureStats:
+
+    def __init__(self):
+        self.received = 0               # Profiles returned by the sensor
+        self.accepted = 0               # Profiles kept
+        self.duplicates = 0             # Profiles dropped for repeating the last measure_count
+        self.missed = 0                 # Measurements skipped between two profiles kept
+        self.last_measure_count = None
+        self.start = time.monotonic()
+        self.producer = None            # Produced, dropped, queue depth and rate of the ProfileProducer, if one was used
+
+    def accept(self, profile):
+        measure_count = profile.measure_count
+        self.received = self.received + 1
+
+        if measure_count == self.last_measure_count:
+            self.duplicates = self.duplicates + 1
+            return False
+
+        if self.last_measure_count is not None:
+            delta = (measure_count - self.last_measure_count) % MEASURE_COUNT_MODULO
+            if delta < MEASURE_COUNT_MODULO // 2:   # Otherwise the sensor restarted its count
+                self.missed = self.missed + delta - 1
+
+        self.last_measure_count = measure_count
+        self.accepted = self.accepted + 1
+        return True
+
+    def rate(self):
+        elapsed = time.monotonic() - self.start
+        return self.accepted / elapsed if elapsed > 0 else 0
+
+    def recordProducer(self, producer):
+        self.producer = {
+            'produced': producer.produced,
+            'dropped': producer.dropped,
+            'depth': producer.depth(),
+            'rate': producer.rate(),
+        }
+
+    def report(self):
+        report = f"Profiles: {self.accepted} | Duplicates: {self.duplicates} | Missed: {self.missed} | Rate: {self.rate():.1f} profiles/s"
+        if self.producer is not None:
+            report = report + " || " + ProfileProducer.format(self.producer)
+        return report
+
+"""
+#################################################################################
+#                                                                               #
+#   Producer thread of a scanner, a PYSDK_SMART.ProfileStream that drops the    #
+#   profiles arriving while its queue is full, so the acquisition never waits   #
+#   for the consumers. Profiles are returned as numpy-backed Profile objects    #
+#                                                                               #
+#################################################################################
+"""
+class ProfileProducer(ProfileStream):
+
+    def __init__(self, scanner, zero_points=True, realtime=True, protocol=kSERVICE, maxsize=2000, as_numpy=True):
+        super().__init__(scanner, zero_points, realtime, protocol, maxsize, block=False, as_numpy=as_numpy, as_object=True)
+        self._start = time.monotonic()
+
+    def start(self):
+        if not self.is_running():
+            self._start = time.monotonic()
+        return super().start()
+
+    def rate(self):
+        elapsed = time.monotonic() - self._start
+        return self.produced / elapsed if elapsed > 0 else 0
+
+    @staticmethod
+    def format(figures):
+        return f"Produced: {figures['produced']} | Dropped: {figures['dropped']} | Queue: {figures['depth']} | Rate: {figures['rate']:.1f} profiles/s"
+
+"""
+#################################################################################
+#                                                                               #
+#   Captures profiles for duration seconds with a ProfileProducer               #
+#   Returns the list of profiles without duplicates and the CaptureStats,       #
+#   with the figures of the producer                                            #
+#                                                                               #
+#################################################################################
+"""
+def captureProfiles(scanner, duration=5, zero_points=True, realtime=True, protocol=kSERVICE):
+    dump = []
+    stats = CaptureStats()
+    producer = ProfileProducer(scanner, zero_points, realtime, protocol).start()
+    deadline = time.monotonic() + duration
+
+    # Profiles are converted here while the producer requests the next ones
+    remaining = duration
+    while remaining > 0:
+        profile = producer.get(timeout=remaining)
+        if profile and stats.accept(profile):
+            dump.append(profile)
+        remaining = deadline - time.monotonic()
+
+    # Profiles received before the deadline and not converted yet
+    producer.stop(drain=False)
+    stats.recordProducer(producer)
+    while producer.depth() > 0:
+        profile = producer.get(timeout=0)
+        if profile and stats.accept(profile):
+            dump.append(profile)
+
+    return dump, stats
+
+class RollingCapture:
+
+    def __init__(self, scanner, window=10, zero_points=True, realtime=True, protocol=kSERVICE):
+        self.scanner = scanner
+        self.window = window                # Seconds of profiles kept in the buffer
+        self.zero_points = zero_points
+        self.realtime = realtime
+        self.protocol = protocol
+        self._buffer = deque()              # (monotonic time, profile) in arrival order
+        self._buffer_mutex = Lock()
+        self._stats = CaptureStats()        # Stats since the last call of takeStats()
+        self._producer = ProfileProducer(scanner, zero_points, realtime, protocol)
+        self._stop_event = Event()
+        self._thread = None
+
+    def start(self):
+        # A consumer still stopping is waited for before the stop event is cleared
+        if self._thread is not None and self._stop_event.is_set():
+            self._thread.join()
+            self._thread = None
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._producer.start()
+            self._thread = Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop_event.set()
+        self._producer.stop(timeout)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if not self._thread.is_alive():
+                self._thread = None
+
+    # Consumer of the producer, converts the profiles and keeps them in the buffer
+    def _run(self):
+        while not self._stop_event.is_set():
+            profile = self._producer.get(timeout=0.5)
+            if not profile:
+                continue
+
+            received = time.monotonic()
+            with self._buffer_mutex:
+                if not self._stats.accept(profile):
+                    continue
+                self._buffer.append((received, profile))
+                self._discardOld(received)
+
+    def _discardOld(self, current):
+        while self._buffer and current - self._buffer[0][0] > self.window:
+            self._buffer.popleft()
+
+    """
+    #################################################################
+    #                                                               #
+    #   Returns a list with the profiles of the last window seconds #
+    #   The buffer is only locked while the references are copied  #
+    #                                                               #
+    #################################################################
+    """
+    def snapshot(self):
+        with self._buffer_mutex:
+            self._discardOld(time.monotonic())
+            return [profile for _, profile in self._buffer]
+
+    def takeStats(self):
+        with self._buffer_mutex:
+            stats = self._stats
+            self._stats = CaptureStats()
+            self._stats.last_measure_count = stats.last_measure_count
+        stats.recordProducer(self._producer)
+        return stats
+
+"""
+#################################################################################
+#                                                                               #
+#   Arms the dump memory of the sensor for count profiles and waits until it    #
+#   is full. Returns False if the recording could not start or did not finish   #
+#   before timeout seconds                                                      #
+#   The parameters are read again every poll_interval seconds, read_params      #
+#   only resets the cache, get_param converts user_dump_size alone              #
+#                                                                               #
+#################################################################################
+"""
+def recordDump(scanner, count, timeout=30, poll_interval=0.5):
+    if not start_dump_recording(scanner, count):
+        return False
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        read_params(scanner)
+        size = get_param(scanner, "user_dump_size")
+        if size is not None and size["value"] >= count:
+            return True
+        time.sleep(poll_interval)
+
+    return False
+
+"""
+#################################################################################
+#                                                                               #
+#   Yields the profiles recorded in the dump memory in chunks of chunk_size     #
+#   The next chunk is downloaded in background while the caller processes       #
+#   the current one                                                             #
+#                                                                               #
+#################################################################################
+"""
+def iterDumpChunks(scanner, count, chunk_size=1000, timeout=1000, protocol=kSERVICE, as_numpy=True):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        download = lambda index: get_dumps_profiles(scanner, index, min(chunk_size, count - index), timeout, protocol, as_numpy, as_object=True)
+        pending = executor.submit(download, 0) if count > 0 else None
+        index = 0
+
+        while pending is not None:
+            chunk = pending.result()
+            index = index + chunk_size
+            pending = executor.submit(download, index) if index < count and len(chunk) > 0 else None
+            yield chunk
+
+"""
+#################################################################################
+#                                                                               #
+#   Records count profiles at full rate in the sensor and downloads them        #
+#   process, when given, is called with each chunk while the next one is        #
+#   downloaded. Returns the list of profiles without duplicates ([] if the      #
+#   recording failed) and the CaptureStats                                      #
+#                                                                               #
+#################################################################################
+"""
+def captureDump(scanner, count, chunk_size=1000, timeout=30, process=None):
+    dump = []
+    stats = CaptureStats()
+    if not recordDump(scanner, count, timeout):
+        return dump, stats
+
+    for chunk in iterDumpChunks(scanner, count, chunk_size):
+        chunk = [profile for profile in chunk if profile and stats.accept(profile)]
+        if process is not None:
+            process(chunk)
+        dump.extend(chunk)
+
+    return dump, stats
+
+"""
+#################################################################################
+#                                                                               #
+#   Runs capture(scanner, *args) for every scanner at the same time, each one   #
+#   in its own thread, so all scanners are captured over the same window        #
+#   Returns the results of capture in the order of scanners                     #
+#                                                                               #
+#################################################################################
+"""
+def captureConcurrently(scanners, capture, *args):
+    if len(scanners) == 0:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(scanners)) as executor:
+        return list(executor.map(lambda scanner: capture(scanner, *args), scanners))
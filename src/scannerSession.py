@@ -0,0 +1,153 @@
+"""
+#######################################################
+#                                                     #
+#   Long-lived session with the RF627 SMART scanners  #
+#                                                     #
+#   The SDK is initialized, the scanners discovered   #
+#   and connected only once. Between captures the     #
+#   connection is checked and a scanner is only       #
+#   reconnected (or discovered again) on failure      #
+#                                                     #
+#   With a cache_path the scanners found are stored   #
+#   on disk and searched directly on the next start   #
+#                                                     #
+#######################################################
+"""
+
+#######################################################
+#                                                     #
+#                      LIBRARIES                      #
+#                                                     #
+#######################################################
+from PYSDK_SMART import *
+from discoveryCache import discoverCached, saveDiscoveryCache
+
+class ScannerSession:
+
+    def __init__(self, protocol=kSERVICE, search_timeout=300, check_timeout=3000, ips=None, expected=None, cache_path=None, parallel=False):
+        self.protocol = protocol
+        self.search_timeout = search_timeout    # Timeout of the "Hello" broadcast on each adapter (ms)
+        self.check_timeout = check_timeout      # Timeout of the connection check between captures (ms)
+        self.ips = ips                          # Known addresses of the scanners, searched directly
+        self.expected = expected                # Serial numbers (or count) ending the search when found
+        self.cache_path = cache_path            # Discovery cache used to reconnect without broadcast
+        self.parallel = parallel                # Probes the known ips of an adapter concurrently
+        self.latency = []                       # Search time of each adapter in the last discovery
+        self.scanners = []                      # Scanners discovered and connected
+        self.release_callbacks = []             # Called with a scanner before it is disconnected, to stop its users
+        self.is_open = False
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    """
+    #################################################################
+    #                                                               #
+    #       Initializes the SDK and connects to every scanner       #
+    #                                                               #
+    #################################################################
+    """
+    def open(self):
+        if not self.is_open:
+            sdk_init()
+            self.is_open = True
+        self.discover()
+        return self.scanners
+
+    """
+    #################################################################
+    #                                                               #
+    #   Broadcasts a search on every adapter (or asks the known     #
+    #   ips directly) and connects to the scanners found. Previous  #
+    #   handles are released because the search rebuilds the list  #
+    #   of scanners of the SDK                                      #
+    #                                                               #
+    #################################################################
+    """
+    def discover(self):
+        self.disconnectAll()
+
+        if self.cache_path is not None and self.ips is None:
+            found, self.latency, cached = discoverCached(self.cache_path, self.search_timeout, self.protocol, self.parallel)
+        else:
+            found, self.latency = discover(self.search_timeout, self.protocol, self.ips, self.expected, self.parallel)
+            cached = False
+
+        # A cached scanner that does not accept the connection is searched again by broadcast
+        if not self._connectAll(found) and cached:
+            self.disconnectAll()
+            found, self.latency = discover(self.search_timeout, self.protocol)
+            self._connectAll(found)
+
+        if self.cache_path is not None and len(self.scanners) > 0:
+            saveDiscoveryCache(self.scanners, self.cache_path, self.protocol)
+
+        return self.scanners
+
+    # Returns False if some scanner could not be connected
+    def _connectAll(self, found):
+        connected = True
+        for scanner in found:
+            if connect(scanner, self.protocol):
+                self.scanners.append(scanner)
+            else:
+                print("Failed to connect to scanner!")
+                connected = False
+        return connected
+
+    """
+    #################################################################
+    #                                                               #
+    #   Checks the connection of every scanner, reconnecting the    #
+    #   ones that failed. A new search is only made when some       #
+    #   scanner could not be reconnected or none is available       #
+    #   Returns the list of scanners ready to capture               #
+    #                                                               #
+    #################################################################
+    """
+    def ensureConnected(self):
+        if not self.is_open:
+            return self.open()
+
+        lost = False
+        for scanner in self.scanners:
+            if check_connection(scanner, self.check_timeout, self.protocol):
+                continue
+
+            self._release(scanner)
+            disconnect(scanner, self.protocol)
+            if not connect(scanner, self.protocol):
+                lost = True
+
+        if lost or len(self.scanners) == 0:
+            self.discover()
+
+        return self.scanners
+
+    def disconnectAll(self):
+        for scanner in self.scanners:
+            self._release(scanner)
+            disconnect(scanner, self.protocol)
+        self.scanners = []
+
+    # Nothing may use the handle of scanner while it is reconnected or released
+    def _release(self, scanner):
+        for callback in self.release_callbacks:
+            callback(scanner)
+
+    """
+    #################################################################
+    #                                                               #
+    #     Disconnects every scanner and releases the SDK resources  #
+    #                                                               #
+    #################################################################
+    """
+    def close(self):
+        if self.is_open:
+            self.disconnectAll()
+            sdk_cleanup()
+            self.is_open = False
@@ -0,0 +1,160 @@
+"""
+#######################################################
+#                                                     #
+#   Compressed archive of the captured 3D surfaces    #
+#                                                     #
+#   Each surface is stored in a ".surf" file where    #
+#   the X, Y and Z matrices are split in chunks of    #
+#   rows (profiles) compressed with zlib, so a        #
+#   region can be read without decompressing the      #
+#   whole surface. An "index.jsonl" file links each   #
+#   scan id to its file, timestamp and belt position  #
+#                                                     #
+#######################################################
+"""
+
+#######################################################
+#                                                     #
+#                      LIBRARIES                      #
+#                                                     #
+#######################################################
+import json, os, struct, zlib, numpy as np
+from threading import Lock
+
+#######################################################
+#                                                     #
+#                     FILE LAYOUT                     #
+#                                                     #
+#   MAGIC | header size (uint32 LE) | JSON header |   #
+#   compressed chunks of every array, in order        #
+#                                                     #
+#######################################################
+MAGIC = b"SURF1\n"
+INDEX_FILE = "index.jsonl"
+DEFAULT_DTYPES = {'X': np.float32, 'Y': np.float32, 'Z': np.float16}
+
+_index_mutex = Lock()
+
+"""
+#################################################################################
+#                                                                               #
+#   Saves the 2D arrays (all with the same shape) in path                       #
+#   Each array is cast to its dtype and split in chunks of chunk_rows rows      #
+#                                                                               #
+#################################################################################
+"""
+def saveSurface(path, arrays, dtypes=DEFAULT_DTYPES, chunk_rows=256, level=6, metadata=None):
+    header = {'shape': None, 'chunk_rows': chunk_rows, 'arrays': {}, 'metadata': metadata or {}}
+    chunks = []
+    offset = 0
+
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array, dtype=dtypes.get(name, np.float32))
+        if header['shape'] is None:
+            header['shape'] = list(array.shape)
+        elif list(array.shape) != header['shape']:
+            raise ValueError(f"Array {name} has shape {array.shape}, expected {tuple(header['shape'])}")
+
+        entries = []
+        for row in range(0, array.shape[0], chunk_rows):
+            chunk = zlib.compress(array[row:row + chunk_rows].tobytes(), level)
+            entries.append([offset, len(chunk)])
+            chunks.append(chunk)
+            offset = offset + len(chunk)
+
+        header['arrays'][name] = {'dtype': array.dtype.str, 'chunks': entries}
+
+    header = json.dumps(header).encode('utf-8')
+
+    with open(path, "wb") as arq:
+        arq.write(MAGIC)
+        arq.write(struct.pack('<I', len(header)))
+        arq.write(header)
+        for chunk in chunks:
+            arq.write(chunk)
+
+def readSurfaceHeader(arq):
+    if arq.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{arq.name} is not a surface archive file")
+    header_size = struct.unpack('<I', arq.read(4))[0]
+    header = json.loads(arq.read(header_size).decode('utf-8'))
+    header['data_start'] = len(MAGIC) + 4 + header_size
+    return header
+
+"""
+#################################################################################
+#                                                                               #
+#   Loads arrays from a ".surf" file                                            #
+#   rows and cols are slices of the region to read, only the chunks holding     #
+#   the rows requested are read from disk and decompressed                      #
+#   Returns a dict name: array and the metadata stored with the surface         #
+#                                                                               #
+#################################################################################
+"""
+def loadSurface(path, names=None, rows=slice(None), cols=slice(None)):
+    result = {}
+
+    with open(path, "rb") as arq:
+        header = readSurfaceHeader(arq)
+        total_rows, total_cols = header['shape']
+        chunk_rows = header['chunk_rows']
+        selected = range(*rows.indices(total_rows))
+
+        for name in (names or header['arrays'].keys()):
+            info = header['arrays'][name]
+            dtype = np.dtype(info['dtype'])
+
+            if len(selected) == 0:
+                result[name] = np.empty((0, total_cols), dtype=dtype)[:, cols]
+                continue
+
+            # The rows are read in increasing order even when step is negative
+            first = min(selected[0], selected[-1]) // chunk_rows
+            last = max(selected[0], selected[-1]) // chunk_rows
+            parts = []
+            for offset, size in info['chunks'][first:last + 1]:
+                arq.seek(header['data_start'] + offset)
+                parts.append(np.frombuffer(zlib.decompress(arq.read(size)), dtype=dtype).reshape(-1, total_cols))
+
+            region = np.concatenate(parts)
+            base = first * chunk_rows
+            stop = selected[-1] - base + (1 if selected.step > 0 else -1)
+            result[name] = region[selected[0] - base:stop if stop >= 0 else None:selected.step, cols]
+
+    return result, header['metadata']
+
+"""
+#################################################################################
+#                                                                               #
+#   Archives a surface in archive_path and appends its entry to the index       #
+#   belt_position is the pulse count of the encoder at the first profile        #
+#   Returns the path of the file created                                        #
+#                                                                               #
+#################################################################################
+"""
+def archiveSurface(archive_path, scan_id, X, Y, Z, timestamp, belt_position, **metadata):
+    os.makedirs(archive_path, exist_ok=True)
+
+    file_name = f"surface{scan_id}.surf"
+    entry = {'scan_id': scan_id, 'file': file_name, 'timestamp': str(timestamp), 'belt_position': belt_position}
+    entry.update(metadata)
+
+    path = os.path.join(archive_path, file_name)
+    saveSurface(path, {'X': X, 'Y': Y, 'Z': Z}, metadata=entry)
+
+    with _index_mutex:
+        with open(os.path.join(archive_path, INDEX_FILE), "a") as arq:
+            arq.write(json.dumps(entry) + "\n")
+
+    return path
+
+def readIndex(archive_path):
+    path = os.path.join(archive_path, INDEX_FILE)
+    if not os.path.exists(path):
+        return []
+
+    with open(path, "r") as arq:
+        return [json.loads(line) for line in arq if line.strip()]
+
+def loadArchivedSurface(archive_path, entry, names=None, rows=slice(None), cols=slice(None)):
+    return loadSurface(os.path.join(archive_path, entry['file']), names, rows, cols)
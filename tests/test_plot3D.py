@@ -0,0 +1,99 @@
+"""
+#######################################################
+#                                                     #
+#   Tests of the surface functions of plot3D          #
+#                                                     #
+#   python -m pytest tests                            #
+#                                                     #
+#######################################################
+"""
+
+#######################################################
+#                                                     #
+#                      LIBRARIES                      #
+#                                                     #
+#######################################################
+import os, sys, types
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# credentials.py holds the settings of each installation and is not in the repository
+sys.modules.setdefault("credentials", types.ModuleType("credentials"))
+
+import plot3D
+
+"""
+#################################################################################
+#                                                                               #
+#   Profiles of a box 3 cm high over a conveyor at 5 mm, 21 points from x = 0   #
+#   to x = 100 mm, one profile every cm along the belt. The first invalid       #
+#   points of each profile are filled by buildSurface with the last point of    #
+#   the previous profile                                                        #
+#                                                                               #
+#################################################################################
+"""
+def boxProfiles(profiles=21, points=21, invalid=3):
+    dump = []
+    for i in range(profiles):
+        data = np.zeros(points, dtype=[('x', '=f4'), ('z', '=f4')])
+        data['x'] = np.linspace(0, 100, points)
+        data['z'] = 35
+        data[:invalid] = 0
+        dump.append(types.SimpleNamespace(points=data, points_count=points, step_count=1000 + i * 200, serial_number=1))
+    return dump
+
+@pytest.fixture
+def conveyor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    np.savetxt("conveyor.txt", [5.0])
+
+def test_volume_of_flat_box():
+    x = np.linspace(0, 10, 21)
+    y = np.linspace(0, 20, 41)
+    X, Y = np.meshgrid(x, y)
+    Z = np.full(X.shape, 3.0)
+
+    assert plot3D.calcSurfaceVolume(X, Y, Z) == pytest.approx(600e-6)
+
+def test_volume_does_not_depend_on_point_order():
+    x = np.linspace(0, 10, 21)
+    y = np.linspace(0, 20, 41)
+    X, Y = np.meshgrid(x, y)
+    Z = 3.0 + np.sin(X) * np.cos(Y)
+    rng = np.random.default_rng(0)
+    points = np.argsort(rng.random(X.shape), axis=1)
+    profiles = rng.permutation(X.shape[0])
+
+    shuffled = [np.take_along_axis(A, points, axis=1)[profiles] for A in (X, Y, Z)]
+    assert plot3D.calcSurfaceVolume(*shuffled) == pytest.approx(plot3D.calcSurfaceVolume(X, Y, Z))
+
+def test_volume_with_forward_filled_points(conveyor):
+    X, Y, Z = plot3D.buildSurface(boxProfiles())
+
+    # The filled points repeat x = 10 cm of the previous profile, the box spans 1.5 to 10 cm
+    assert plot3D.calcSurfaceVolume(X, Y, Z) == pytest.approx(8.5 * 3 * 20 * 1e-6)
+
+def test_interp_rows_matches_np_interp():
+    rng = np.random.default_rng(1)
+    xp = np.sort(rng.uniform(0, 10, (6, 15)), axis=1)
+    fp = rng.uniform(-5, 5, (6, 15))
+    x = np.linspace(-1, 11, 50)
+
+    result = plot3D.interpRows(xp, fp, x, outside=-1.0)
+    for row in range(xp.shape[0]):
+        np.testing.assert_allclose(result[row], np.interp(x, xp[row], fp[row], left=-1.0, right=-1.0))
+
+def test_resample_surface_matches_np_interp():
+    rng = np.random.default_rng(2)
+    X = np.sort(rng.uniform(0, 10, (8, 30)), axis=1)
+    Y = np.repeat(np.sort(rng.uniform(0, 20, 8))[:, np.newaxis], 30, axis=1)
+    Z = rng.uniform(0, 5, X.shape)
+
+    Xg, Yg, Zg = plot3D.resampleSurface(X, Y, Z, x_step=0.5, y_step=1.0)
+
+    x_grid, y_grid = Xg[0], Yg[:, 0]
+    rows = np.array([np.interp(x_grid, X[i], Z[i], left=0, right=0) for i in range(X.shape[0])])
+    expected = np.array([np.interp(y_grid, Y[:, 0], rows[:, j]) for j in range(x_grid.size)]).T
+    np.testing.assert_allclose(Zg, expected)